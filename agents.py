@@ -1,10 +1,12 @@
 import json
 import re
 import os
+import threading
 from typing import Dict, Any, List, Union
 import together
 from dotenv import load_dotenv
 from data import FLIGHT_DATABASE, SAMPLE_TRANSCRIPTS
+from classifier import get_model_path, has_trained_model, load_model
 
 load_dotenv("api_keys.env")
 
@@ -29,6 +31,40 @@ def invoke_together_model(prompt: str, model: str = "mistralai/Mixtral-8x7B-Inst
     
     return response
 
+CATEGORIZATION_BACKENDS = ["together", "local", "keywords"]
+
+_local_classifier = None
+_local_classifier_lock = threading.Lock()
+_backend_warnings = set()
+
+def get_categorization_backend() -> str:
+    backend = os.getenv('CATEGORIZATION_BACKEND', 'auto').lower()
+    
+    if backend == "auto":
+        if is_together_available():
+            return "together"
+        return "local" if has_trained_model() else "keywords"
+    if backend not in CATEGORIZATION_BACKENDS:
+        raise ValueError(f"Unknown categorization backend '{backend}'. Choose one of: auto, {', '.join(CATEGORIZATION_BACKENDS)}")
+    
+    if backend == "together" and not is_together_available():
+        return "keywords"
+    if backend == "local" and not has_trained_model():
+        warning = f"No trained call classifier at {get_model_path()}. Run train_classifier.py; using keyword categorization until then."
+        if warning not in _backend_warnings:
+            _backend_warnings.add(warning)
+            print(f"Warning: {warning}")
+        return "keywords"
+    return backend
+
+def invoke_local_classifier(transcripts: List[str]) -> List[str]:
+    global _local_classifier
+    with _local_classifier_lock:
+        if _local_classifier is None:
+            _local_classifier = load_model()
+    
+    return _local_classifier.predict(transcripts)
+
 def get_flight_info(flight_number: str) -> Dict[str, Any]:
     flight_number = flight_number.upper()
     
@@ -145,19 +181,77 @@ def qa_agent_respond(user_query: str) -> str:
     except Exception as e:
         return json.dumps({"answer": f"Error processing request: {str(e)}"})
 
+def keyword_categorize(transcript: str) -> str:
+    """Return the last category, in the order below, with a keyword in the transcript.
+
+    Later categories deliberately override earlier ones. Keywords are matched as
+    substrings of the whole call, and nearly every call contains "booking reference",
+    so stopping at the first match would label almost everything Flight Booking.
+    """
+    categories = {
+        "Flight Booking": ["book", "reserve", "purchase", "buy", "schedule"],
+        "Flight Cancellation": ["cancel", "refund", "money back"],
+        "Flight Rescheduling": ["reschedule", "change", "move", "different date"],
+        "Baggage Issue": ["baggage", "luggage", "bag", "suitcase", "missing", "lost"],
+        "Complaint": ["complaint", "unhappy", "disappointed", "poor", "terrible", "bad experience", "upset"],
+        "Seat Change": ["seat", "change seat", "different seat", "window", "aisle"],
+        "General Inquiry": ["status", "check", "information", "time", "when"]
+    }
+    
+    transcript_lower = transcript.lower()
+    determined_category = "General Inquiry"
+    
+    for category, keywords in categories.items():
+        for keyword in keywords:
+            if keyword in transcript_lower:
+                determined_category = category
+                break
+    
+    return determined_category
+
+def build_categorization(transcript: str, determined_category: str) -> Dict[str, Any]:
+    transcript_lower = transcript.lower()
+    
+    flight_numbers = []
+    pattern = r'([A-Za-z]{1,3}\d{1,4})'
+    matches = re.findall(pattern, transcript)
+    if matches:
+        flight_numbers = [match for match in matches if match.upper().startswith('AI')]
+    
+    resolved = "thank you" in transcript_lower and "have a" in transcript_lower
+    resolution_status = "Resolved" if resolved else "Pending"
+    
+    customer_name = "Unknown"
+    name_patterns = [
+        r'name is ([A-Za-z\s]+),',
+        r'name is ([A-Za-z\s]+)\.', 
+        r'I\'m ([A-Za-z\s]+),',
+        r'this is ([A-Za-z\s]+),'
+    ]
+    
+    for pattern in name_patterns:
+        name_match = re.search(pattern, transcript)
+        if name_match:
+            customer_name = name_match.group(1).strip()
+            break
+    
+    details = {
+        "flight_numbers": flight_numbers,
+        "customer_name": customer_name,
+        "resolution_status": resolution_status,
+        "call_summary": f"{determined_category} related to flight(s): {', '.join(flight_numbers) if flight_numbers else 'None specified'}"
+    }
+    
+    return {
+        "category": determined_category,
+        "details": details
+    }
+
 def categorize_call(transcript: str) -> str:
     try:
-        categories = {
-            "Flight Booking": ["book", "reserve", "purchase", "buy", "schedule"],
-            "Flight Cancellation": ["cancel", "refund", "money back"],
-            "Flight Rescheduling": ["reschedule", "change", "move", "different date"],
-            "Baggage Issue": ["baggage", "luggage", "bag", "suitcase", "missing", "lost"],
-            "Complaint": ["complaint", "unhappy", "disappointed", "poor", "terrible", "bad experience", "upset"],
-            "Seat Change": ["seat", "change seat", "different seat", "window", "aisle"],
-            "General Inquiry": ["status", "check", "information", "time", "when"]
-        }
+        backend = get_categorization_backend()
         
-        if is_together_available():
+        if backend == "together":
             try:
                 prompt = f"""
                 You are an AI assistant that categorizes airline call center conversations. 
@@ -184,49 +278,12 @@ def categorize_call(transcript: str) -> str:
             except Exception as e:
                 print(f"Error using Together AI for categorization: {str(e)}")
         
-        transcript_lower = transcript.lower()
-        determined_category = "General Inquiry"
-        
-        for category, keywords in categories.items():
-            for keyword in keywords:
-                if keyword in transcript_lower:
-                    determined_category = category
-                    break
-        
-        flight_numbers = []
-        pattern = r'([A-Za-z]{1,3}\d{1,4})'
-        matches = re.findall(pattern, transcript)
-        if matches:
-            flight_numbers = [match for match in matches if match.upper().startswith('AI')]
-        
-        resolved = "thank you" in transcript_lower and "have a" in transcript_lower
-        resolution_status = "Resolved" if resolved else "Pending"
-        
-        customer_name = "Unknown"
-        name_patterns = [
-            r'name is ([A-Za-z\s]+),',
-            r'name is ([A-Za-z\s]+)\.', 
-            r'I\'m ([A-Za-z\s]+),',
-            r'this is ([A-Za-z\s]+),'
-        ]
-        
-        for pattern in name_patterns:
-            name_match = re.search(pattern, transcript)
-            if name_match:
-                customer_name = name_match.group(1).strip()
-                break
-        
-        details = {
-            "flight_numbers": flight_numbers,
-            "customer_name": customer_name,
-            "resolution_status": resolution_status,
-            "call_summary": f"{determined_category} related to flight(s): {', '.join(flight_numbers) if flight_numbers else 'None specified'}"
-        }
+        if backend == "local":
+            determined_category = invoke_local_classifier([transcript])[0]
+        else:
+            determined_category = keyword_categorize(transcript)
         
-        return json.dumps({
-            "category": determined_category,
-            "details": details
-        })
+        return json.dumps(build_categorization(transcript, determined_category))
     
     except Exception as e:
         return json.dumps({"error": f"Error categorizing call: {str(e)}"})
@@ -241,8 +298,13 @@ def compute_call_center_kpis(transcripts: List[str]) -> str:
         flight_mentions = {}
         customer_sentiments = []
         
-        for transcript in transcripts:
-            categorization = json.loads(categorize_call(transcript))
+        # The local classifier scores the whole batch at once; other backends go call by call
+        if get_categorization_backend() == "local":
+            categorizations = [build_categorization(transcript, category) for transcript, category in zip(transcripts, invoke_local_classifier(transcripts))]
+        else:
+            categorizations = [json.loads(categorize_call(transcript)) for transcript in transcripts]
+        
+        for transcript, categorization in zip(transcripts, categorizations):
             category = categorization.get("category", "Unknown")
             details = categorization.get("details", {})
             
@@ -5,14 +5,19 @@ from dotenv import load_dotenv
 from data import SAMPLE_TRANSCRIPTS
 from agents import (
     is_together_available, 
+    get_categorization_backend, 
     info_agent_request, 
     qa_agent_respond, 
     categorize_call, 
     compute_call_center_kpis
 )
+from scheduler import INTERACTIVE, HEAVY, call_center_scheduler, scheduled, scheduler_metrics_ui
 
 load_dotenv()
 
+# Requests allowed to wait in Gradio's own queue before it turns new ones away
+GRADIO_QUEUE_MAX_SIZE = 64
+
 custom_css = """
 .json-container {
     background-color: #f5f5f5;
@@ -43,7 +48,22 @@ def format_json_for_display(json_str):
     except json.JSONDecodeError:
         return f"Error parsing JSON: {json_str}"
 
+def categorization_status(task):
+    try:
+        backend = get_categorization_backend()
+    except ValueError as e:
+        return str(e)
+    
+    if backend == "together":
+        return f"Using Together AI for enhanced {task}."
+    if backend == "local":
+        return f"Using the local classifier for {task}."
+    if is_together_available():
+        return f"Using pattern-based {task}."
+    return f"Together AI not available. Using pattern-based {task}."
+
 # Info Agent tab
+@scheduled(INTERACTIVE)
 def info_agent_ui(flight_number):
     if not flight_number:
         return "Please enter a flight number."
@@ -52,6 +72,7 @@ def info_agent_ui(flight_number):
     return format_json_for_display(response)
 
 # QA Agent tab
+@scheduled(INTERACTIVE)
 def qa_agent_ui(user_query):
     if not user_query:
         return "Please enter a question about a flight."
@@ -64,13 +85,14 @@ def qa_agent_ui(user_query):
     return f"{together_status}\n\n{formatted_response}"
 
 # Call Categorization tab 
+@scheduled(HEAVY)
 def categorize_sample_transcript(transcript_index):
     if transcript_index is None or transcript_index < 0:
         return "Please select a sample transcript."
     
     transcript = SAMPLE_TRANSCRIPTS[transcript_index]
     
-    together_status = "Using Together AI for enhanced categorization." if is_together_available() else "Together AI not available. Using pattern-based categorization."
+    together_status = categorization_status("categorization")
     
     response = categorize_call(transcript)
     formatted_response = format_json_for_display(response)
@@ -78,11 +100,12 @@ def categorize_sample_transcript(transcript_index):
     return f"{together_status}\n\n{formatted_response}"
 
 # Call Categorization tab 
+@scheduled(HEAVY)
 def categorize_custom_transcript(custom_transcript):
     if not custom_transcript:
         return "Please enter a transcript to categorize."
     
-    together_status = "Using Together AI for enhanced categorization." if is_together_available() else "Together AI not available. Using pattern-based categorization."
+    together_status = categorization_status("categorization")
     
     response = categorize_call(custom_transcript)
     formatted_response = format_json_for_display(response)
@@ -90,14 +113,24 @@ def categorize_custom_transcript(custom_transcript):
     return f"{together_status}\n\n{formatted_response}"
 
 # KPI Analysis tab
+@scheduled(HEAVY)
 def kpi_analysis_ui():
-    together_status = "Using Together AI for enhanced KPI analysis." if is_together_available() else "Together AI not available. Using pattern-based analysis."
+    together_status = categorization_status("KPI analysis")
     
     response = compute_call_center_kpis(SAMPLE_TRANSCRIPTS)
     formatted_response = format_json_for_display(response)
     
     return f"{together_status}\n\n{formatted_response}"
 
+def gradio_queue_metrics(app):
+    queue = app._queue
+    return {
+        "max_workers": queue.max_thread_count,
+        "active_workers": sum(1 for job in queue.active_jobs if job is not None),
+        "queue_depth": len(queue.event_queue),
+        "max_queue_depth": queue.max_size
+    }
+
 def display_transcript(transcript_index):
     if transcript_index is None or transcript_index < 0:
         return ""
@@ -247,6 +280,24 @@ def create_app():
                     inputs=[],
                     outputs=kpi_output
                 )
+            
+            with gr.TabItem("System Metrics"):
+                gr.Markdown("Queue depth, wait times and load shedding for the interactive (Info, Query) and heavy (Categorization, KPI) queues, plus Gradio's own request queue.")
+                
+                metrics_button = gr.Button("Refresh Metrics", variant="primary")
+                
+                metrics_output = gr.Textbox(
+                    label="Scheduler Metrics (JSON)", 
+                    placeholder="Scheduler metrics will appear here...",
+                    lines=20
+                )
+                
+                metrics_button.click(
+                    fn=scheduler_metrics_ui,
+                    inputs=[],
+                    outputs=metrics_output,
+                    queue=False
+                )
         
         gr.Markdown(
             """
@@ -255,6 +306,9 @@ def create_app():
             """
         )
     
+    app.queue(concurrency_count=call_center_scheduler.worker_slots(), max_size=GRADIO_QUEUE_MAX_SIZE)
+    call_center_scheduler.watch_queue("gradio", lambda: gradio_queue_metrics(app))
+    
     return app
 
 if __name__ == "__main__":
@@ -0,0 +1,181 @@
+import os
+import re
+import threading
+import zlib
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "models", "call_classifier.npz")
+DEFAULT_N_FEATURES = 2 ** 18
+
+# Transcripts featurised at once; bounds the temporary feature arrays and keeps them in cache
+BATCH_SIZE = 2048
+
+# Joined between transcripts so a whole batch is tokenised with one split()
+_BOUNDARY = "\x01"
+_BOUNDARY_HASH = 2 ** 32
+
+# Everything except ASCII letters, digits, apostrophes and the boundary separates words
+_SEPARATORS = str.maketrans({chr(i): " " for i in range(128) if not (chr(i).isalnum() or chr(i) in "'" + _BOUNDARY)})
+
+MAX_HASH_CACHE_SIZE = 2 ** 20
+
+# Word -> crc32; unlike hash() it is stable between runs, so saved models stay valid
+_word_hashes: Dict[str, int] = {_BOUNDARY: _BOUNDARY_HASH}
+_word_hashes_lock = threading.Lock()
+
+def tokenize(text: str) -> List[str]:
+    return text.lower().translate(_SEPARATORS).split()
+
+def _mix(hashes: np.ndarray) -> np.ndarray:
+    hashes = hashes ^ (hashes >> np.uint64(29))
+    hashes = hashes * np.uint64(0xBF58476D1CE4E5B9)
+    return hashes ^ (hashes >> np.uint64(32))
+
+def hash_features(texts: Sequence[str], n_features: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Bag of unigrams and bigrams as row-sorted (row, column) pairs plus a per-row L2 norm
+    joined = f" {_BOUNDARY} ".join(texts)
+    if joined.count(_BOUNDARY) != max(len(texts) - 1, 0):
+        joined = f" {_BOUNDARY} ".join(text.replace(_BOUNDARY, " ") for text in texts)
+
+    words = tokenize(joined)
+
+    # Held across fill and lookup so another thread cannot clear the cache in between
+    with _word_hashes_lock:
+        if len(_word_hashes) > MAX_HASH_CACHE_SIZE:
+            _word_hashes.clear()
+            _word_hashes[_BOUNDARY] = _BOUNDARY_HASH
+        for word in set(words).difference(_word_hashes):
+            _word_hashes[word] = zlib.crc32(word.encode("utf-8"))
+        hashes = np.fromiter(map(_word_hashes.__getitem__, words), dtype=np.uint64, count=len(words))
+
+    boundary = hashes == np.uint64(_BOUNDARY_HASH)
+    rows = np.cumsum(boundary)[~boundary]
+    hashes = hashes[~boundary]
+
+    # Interleave each word with its bigram on the next word, dropping bigrams that cross transcripts
+    features = np.empty(2 * len(hashes), dtype=np.uint64)
+    features[0::2] = _mix(hashes)
+    features[1::2] = _mix(hashes * np.uint64(0x9E3779B1) + np.roll(hashes, -1))
+
+    keep = np.ones(2 * len(hashes), dtype=bool)
+    keep[1::2] = np.append(rows[1:] == rows[:-1], False)
+
+    rows = np.repeat(rows, 2)[keep]
+    columns = (features[keep] % np.uint64(n_features)).astype(np.int64)
+
+    counts = np.bincount(rows, minlength=len(texts))
+    norms = (1.0 / np.sqrt(np.maximum(counts, 1))).astype(np.float32)
+    return rows, columns, norms
+
+def _sparse_dot(weights: np.ndarray, rows: np.ndarray, columns: np.ndarray, norms: np.ndarray) -> np.ndarray:
+    scores = np.zeros((len(norms), weights.shape[1]), dtype=weights.dtype)
+    if not len(columns):
+        return scores
+
+    starts = np.searchsorted(rows, np.arange(len(norms)))
+    nonempty = np.diff(np.append(starts, len(rows))) > 0
+    scores[nonempty] = np.add.reduceat(weights[columns], starts[nonempty], axis=0)
+    return scores * norms[:, None]
+
+def _softmax(scores: np.ndarray) -> np.ndarray:
+    exp = np.exp(scores - scores.max(axis=1, keepdims=True))
+    return exp / exp.sum(axis=1, keepdims=True)
+
+class HashedLinearClassifier:
+    def __init__(self, classes: Sequence[str], weights: np.ndarray, bias: np.ndarray):
+        self.classes = list(classes)
+        self.weights = weights
+        self.bias = bias
+
+    @property
+    def n_features(self) -> int:
+        return self.weights.shape[0]
+
+    @classmethod
+    def fit(cls, texts: Sequence[str], labels: Sequence[str], n_features: int = DEFAULT_N_FEATURES,
+            epochs: int = 300, learning_rate: float = 2.0, l2: float = 1e-4) -> "HashedLinearClassifier":
+        classes = sorted(set(labels))
+        class_index = {label: i for i, label in enumerate(classes)}
+        targets = np.zeros((len(texts), len(classes)), dtype=np.float32)
+        targets[np.arange(len(texts)), [class_index[label] for label in labels]] = 1.0
+
+        rows, columns, norms = hash_features(texts, n_features)
+        values = norms[rows]
+
+        # Only columns that occur in the training data ever receive a gradient
+        seen_columns, local_columns = np.unique(columns, return_inverse=True)
+        local_weights = np.zeros((len(seen_columns), len(classes)), dtype=np.float32)
+        bias = np.zeros(len(classes), dtype=np.float32)
+
+        # Full-batch gradient descent on the multinomial logistic loss
+        for _ in range(epochs):
+            scores = _sparse_dot(local_weights, rows, local_columns, norms) + bias
+            error = (_softmax(scores) - targets) / len(texts)
+
+            contributions = error[rows] * values[:, None]
+            gradient = np.empty_like(local_weights)
+            for c in range(len(classes)):
+                gradient[:, c] = np.bincount(local_columns, weights=contributions[:, c], minlength=len(seen_columns))
+            gradient += l2 * local_weights
+
+            local_weights -= learning_rate * gradient
+            bias -= learning_rate * error.sum(axis=0)
+
+        weights = np.zeros((n_features, len(classes)), dtype=np.float32)
+        weights[seen_columns] = local_weights
+        return cls(classes, weights, bias)
+
+    def decision_function(self, texts: Sequence[str]) -> np.ndarray:
+        scores = np.empty((len(texts), len(self.classes)), dtype=np.float32)
+        for start in range(0, len(texts), BATCH_SIZE):
+            rows, columns, norms = hash_features(texts[start:start + BATCH_SIZE], self.n_features)
+            scores[start:start + BATCH_SIZE] = _sparse_dot(self.weights, rows, columns, norms) + self.bias
+        return scores
+
+    def predict_proba(self, texts: Sequence[str]) -> np.ndarray:
+        return _softmax(self.decision_function(texts))
+
+    def predict(self, texts: Sequence[str]) -> List[str]:
+        if not texts:
+            return []
+        best = self.decision_function(texts).argmax(axis=1)
+        return [self.classes[i] for i in best]
+
+    def save(self, path: str) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # Store only the non-zero rows; most hashed columns are never seen in training
+        columns = np.flatnonzero(np.any(self.weights != 0, axis=1))
+        np.savez_compressed(
+            path,
+            classes=np.array(self.classes),
+            n_features=np.array(self.n_features),
+            columns=columns,
+            weights=self.weights[columns],
+            bias=self.bias
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "HashedLinearClassifier":
+        with np.load(path) as model:
+            weights = np.zeros((int(model["n_features"]), len(model["classes"])), dtype=np.float32)
+            weights[model["columns"]] = model["weights"]
+            return cls([str(label) for label in model["classes"]], weights, model["bias"])
+
+def train_from_labelled(examples: Sequence[Dict[str, str]], **kwargs) -> HashedLinearClassifier:
+    texts = [example["transcript"] for example in examples]
+    labels = [example["category"] for example in examples]
+    return HashedLinearClassifier.fit(texts, labels, **kwargs)
+
+def get_model_path() -> str:
+    return os.getenv("CALL_CLASSIFIER_MODEL", DEFAULT_MODEL_PATH)
+
+def has_trained_model() -> bool:
+    return os.path.exists(get_model_path())
+
+def load_model(path: Optional[str] = None) -> HashedLinearClassifier:
+    path = path or get_model_path()
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"No trained call classifier at {path}. Run train_classifier.py to create one.")
+    return HashedLinearClassifier.load(path)
@@ -120,3 +120,365 @@ SAMPLE_TRANSCRIPTS = [
     Agent: You're welcome. Have a safe journey.
     """
 ]
+
+
+LABELLED_TRANSCRIPTS = [
+    {
+        "category": "General Inquiry",
+        "transcript": SAMPLE_TRANSCRIPTS[0]
+    },
+    {
+        "category": "Flight Rescheduling",
+        "transcript": SAMPLE_TRANSCRIPTS[1]
+    },
+    {
+        "category": "Flight Booking",
+        "transcript": """
+    Agent: Thank you for calling Air Express. How may I help you?
+    Customer: I'd like to book a flight from Delhi to Mumbai next Friday.
+    Agent: Certainly. We have AI456 departing at 10:30 AM. Shall I reserve a seat for you?
+    Customer: Yes, one adult ticket please.
+    Agent: Your ticket is booked. The confirmation has been sent to your email.
+    """
+    },
+    {
+        "category": "Flight Booking",
+        "transcript": """
+    Agent: Air Express, how can I help?
+    Customer: I want to buy two tickets to Bangalore for my parents.
+    Agent: Of course. Flight AI789 has availability on the 14th. Would you like me to make the reservation?
+    Customer: Yes please, and add them to the same booking.
+    Agent: Done. Both passengers are booked and the payment went through.
+    """
+    },
+    {
+        "category": "Flight Booking",
+        "transcript": """
+    Agent: Good afternoon, Air Express. How may I assist you?
+    Customer: Hi, I need a new reservation for a business trip to Chennai.
+    Agent: I can help with that. Which date are you looking to travel?
+    Customer: Monday morning, economy class.
+    Agent: I've booked you on the 7 AM departure. Your booking reference is QWE456.
+    """
+    },
+    {
+        "category": "Flight Booking",
+        "transcript": """
+    Agent: Thank you for calling Air Express.
+    Customer: Are there any seats left on flight AI234 tomorrow? I want to purchase a ticket.
+    Agent: Yes, there are a few economy fares left. Shall I book one for you?
+    Customer: Please do.
+    Agent: Your purchase is complete and your e-ticket is on its way.
+    """
+    },
+    {
+        "category": "Flight Booking",
+        "transcript": """
+    Agent: Air Express reservations, how can I help?
+    Customer: I'm planning a family holiday and want to book flights for four people to Goa.
+    Agent: Wonderful. I have a fare available on the 22nd. Shall I hold the booking?
+    Customer: Yes, go ahead and confirm it.
+    Agent: All four passengers are booked. Enjoy your holiday.
+    """
+    },
+    {
+        "category": "Flight Cancellation",
+        "transcript": """
+    Agent: Thank you for calling Air Express. How may I help?
+    Customer: I need to cancel my flight AI123 next week. My meeting was called off.
+    Agent: I can cancel that for you. Your fare is eligible for a refund to the original card.
+    Customer: Great, please cancel it.
+    Agent: Your booking has been cancelled and the refund will arrive in 5 to 7 days.
+    """
+    },
+    {
+        "category": "Flight Cancellation",
+        "transcript": """
+    Agent: Air Express, how can I help you today?
+    Customer: I want my money back for flight AI456. I won't be travelling anymore.
+    Agent: I'm sorry to hear that. Let me cancel the reservation and process your refund.
+    Customer: How long will the refund take?
+    Agent: It should reach your account within a week.
+    """
+    },
+    {
+        "category": "Flight Cancellation",
+        "transcript": """
+    Agent: Good evening, Air Express.
+    Customer: Hi, due to a family emergency I can't fly on Saturday. Can I cancel my ticket?
+    Agent: Of course. I've cancelled your ticket and waived the cancellation fee.
+    Customer: Thank you, that's very kind.
+    Agent: You're welcome. Take care.
+    """
+    },
+    {
+        "category": "Flight Cancellation",
+        "transcript": """
+    Agent: Thank you for calling Air Express.
+    Customer: Flight AI567 was cancelled by the airline and I'd like a full refund instead of another flight.
+    Agent: I understand. I've requested a full refund for the cancelled flight.
+    Customer: Will I get an email confirmation?
+    Agent: Yes, you'll receive a refund confirmation shortly.
+    """
+    },
+    {
+        "category": "Flight Cancellation",
+        "transcript": """
+    Agent: Air Express, how may I assist?
+    Customer: Please cancel both of our return tickets to Kolkata. We are no longer going.
+    Agent: Both tickets are now cancelled. You will receive travel credit for the full amount.
+    Customer: Can I get it refunded to my card instead?
+    Agent: Yes, I've switched it to a card refund for you.
+    """
+    },
+    {
+        "category": "Flight Rescheduling",
+        "transcript": """
+    Agent: Thank you for calling Air Express.
+    Customer: I'd like to change my flight to a different date. I'm booked on AI123 on Monday.
+    Agent: Sure. Which day would you prefer instead?
+    Customer: Wednesday, same time if possible.
+    Agent: I've moved you to Wednesday's 8 AM departure. There's no change fee.
+    """
+    },
+    {
+        "category": "Flight Rescheduling",
+        "transcript": """
+    Agent: Air Express, how can I help?
+    Customer: My conference was extended, so I need to reschedule my return flight by two days.
+    Agent: No problem. I can move you to AI890 on Thursday evening.
+    Customer: That works.
+    Agent: Your return flight has been rescheduled and a new itinerary has been emailed.
+    """
+    },
+    {
+        "category": "Flight Rescheduling",
+        "transcript": """
+    Agent: Good morning, Air Express.
+    Customer: Can I move my flight AI456 to an earlier departure today?
+    Agent: Let me check. There's a seat on the 7 AM flight. Shall I switch you over?
+    Customer: Yes, please change it.
+    Agent: Done. You're now on the earlier departure.
+    """
+    },
+    {
+        "category": "Flight Rescheduling",
+        "transcript": """
+    Agent: Thank you for calling Air Express.
+    Customer: My connecting flight was delayed and I'll miss my onward flight to Mumbai. Can you rebook me?
+    Agent: I'm sorry about that. I've rebooked you on the next available flight at 4 PM.
+    Customer: Thank you, that helps a lot.
+    Agent: Your updated boarding pass is in your email.
+    """
+    },
+    {
+        "category": "Flight Rescheduling",
+        "transcript": """
+    Agent: Air Express, how may I help?
+    Customer: I need to push my trip to Hyderabad back a week. Is that possible?
+    Agent: Yes, I can change your travel date to the 19th for a small fare difference.
+    Customer: Okay, please go ahead.
+    Agent: Your booking has been updated to the new date.
+    """
+    },
+    {
+        "category": "Baggage Issue",
+        "transcript": """
+    Agent: Thank you for calling Air Express. How can I help?
+    Customer: I arrived on flight AI789 but my luggage never came out on the belt.
+    Agent: I'm sorry. Let me file a missing baggage report. Can you describe the suitcase?
+    Customer: It's a large blue suitcase with a red tag.
+    Agent: The report is filed. We'll deliver it to your address as soon as it's found.
+    """
+    },
+    {
+        "category": "Baggage Issue",
+        "transcript": """
+    Agent: Air Express, how may I help?
+    Customer: My bag was damaged on my flight from Delhi. The handle is broken.
+    Agent: I apologise for that. I'll open a damaged baggage claim for you.
+    Customer: Do I need to send photos?
+    Agent: Yes, please email photos of the bag along with your baggage tag number.
+    """
+    },
+    {
+        "category": "Baggage Issue",
+        "transcript": """
+    Agent: Good afternoon, Air Express.
+    Customer: What is the checked baggage allowance on an economy ticket to Mumbai?
+    Agent: Economy includes one checked bag up to 15 kilograms plus a cabin bag.
+    Customer: Can I pay for extra baggage now?
+    Agent: Yes, I've added an extra 10 kilograms to your booking.
+    """
+    },
+    {
+        "category": "Baggage Issue",
+        "transcript": """
+    Agent: Thank you for calling Air Express.
+    Customer: I filed a lost luggage report three days ago and still haven't heard anything.
+    Agent: Let me check the tracing system. Your bag has been located in Chennai.
+    Customer: When will I get it?
+    Agent: It will be delivered to your hotel tomorrow morning.
+    """
+    },
+    {
+        "category": "Baggage Issue",
+        "transcript": """
+    Agent: Air Express, how can I help you?
+    Customer: I left my backpack on the plane after flight AI345 landed.
+    Agent: I'll contact the lost and found team at the airport for you.
+    Customer: It has my laptop inside.
+    Agent: I've logged the item. They'll call you once it's recovered.
+    """
+    },
+    {
+        "category": "Complaint",
+        "transcript": """
+    Agent: Thank you for calling Air Express.
+    Customer: I want to make a complaint. The crew on my flight were rude and unhelpful.
+    Agent: I'm very sorry to hear that. I'll log your complaint with our customer relations team.
+    Customer: This is the second time this has happened. I'm really disappointed.
+    Agent: I understand. Someone will follow up with you within 48 hours.
+    """
+    },
+    {
+        "category": "Complaint",
+        "transcript": """
+    Agent: Air Express, how may I help?
+    Customer: I'm very unhappy with the service. The flight was delayed four hours and nobody told us anything.
+    Agent: I apologise for the poor communication. I'll record this as formal feedback.
+    Customer: We weren't even offered food or water. Terrible experience.
+    Agent: I've added a meal voucher to your account and escalated the issue.
+    """
+    },
+    {
+        "category": "Complaint",
+        "transcript": """
+    Agent: Good evening, Air Express.
+    Customer: I'm calling to complain about the dirty cabin on flight AI678. The seats were filthy.
+    Agent: I'm sorry about that. That's not the standard we expect.
+    Customer: I expect some compensation for this.
+    Agent: I've passed your complaint to our quality team and they will contact you.
+    """
+    },
+    {
+        "category": "Complaint",
+        "transcript": """
+    Agent: Thank you for calling Air Express.
+    Customer: I'm upset that I was charged twice for the same ticket and nobody has fixed it.
+    Agent: I apologise for the inconvenience. Let me escalate this to our billing team.
+    Customer: I've been on hold for an hour. This is unacceptable.
+    Agent: I understand your frustration. The duplicate charge will be reversed today.
+    """
+    },
+    {
+        "category": "Complaint",
+        "transcript": """
+    Agent: Air Express, how can I help?
+    Customer: I had a bad experience at the check-in counter. The staff ignored us for thirty minutes.
+    Agent: I'm sorry for the poor service you received.
+    Customer: I want my feedback sent to the airport manager.
+    Agent: I've filed a formal complaint and shared it with the airport manager.
+    """
+    },
+    {
+        "category": "Seat Change",
+        "transcript": """
+    Agent: Thank you for calling Air Express.
+    Customer: Can I change my seat on flight AI123? I'd prefer a window seat.
+    Agent: Let me check. Seat 14A is available. Shall I assign it?
+    Customer: Yes, please.
+    Agent: Done. You're now in seat 14A by the window.
+    """
+    },
+    {
+        "category": "Seat Change",
+        "transcript": """
+    Agent: Air Express, how may I help?
+    Customer: My wife and I were given seats in different rows. Can we sit together?
+    Agent: I can move you both to seats 22B and 22C.
+    Customer: That would be perfect.
+    Agent: Your seats have been updated.
+    """
+    },
+    {
+        "category": "Seat Change",
+        "transcript": """
+    Agent: Good morning, Air Express.
+    Customer: I'm tall and need more legroom. Is an exit row seat available on AI456?
+    Agent: Yes, 12C in the exit row is free. There's a small upgrade fee.
+    Customer: That's fine, please book it.
+    Agent: Your seat has been changed to 12C.
+    """
+    },
+    {
+        "category": "Seat Change",
+        "transcript": """
+    Agent: Thank you for calling Air Express.
+    Customer: I'd like to switch from the middle seat to an aisle seat for my flight tomorrow.
+    Agent: Certainly. Aisle seat 9D is available.
+    Customer: Great, I'll take it.
+    Agent: You're all set in 9D.
+    """
+    },
+    {
+        "category": "Seat Change",
+        "transcript": """
+    Agent: Air Express, how can I help?
+    Customer: I'm travelling with a toddler. Could you move us to a bulkhead seat?
+    Agent: Let me look. I can seat you in row 1 with space for a bassinet.
+    Customer: Thank you so much.
+    Agent: Your seat assignment has been updated.
+    """
+    },
+    {
+        "category": "General Inquiry",
+        "transcript": """
+    Agent: Thank you for calling Air Express.
+    Customer: What time does flight AI789 depart, and which terminal is it from?
+    Agent: AI789 departs at 2:15 PM from Terminal 3, gate G5.
+    Customer: Is it on time?
+    Agent: Yes, it's currently showing on time.
+    """
+    },
+    {
+        "category": "General Inquiry",
+        "transcript": """
+    Agent: Air Express, how may I help?
+    Customer: When does online check-in open for my flight?
+    Agent: Online check-in opens 48 hours before departure.
+    Customer: And when does the gate close?
+    Agent: The gate closes 25 minutes before departure.
+    """
+    },
+    {
+        "category": "General Inquiry",
+        "transcript": """
+    Agent: Good afternoon, Air Express.
+    Customer: Do you allow pets in the cabin on domestic flights?
+    Agent: Small pets in an approved carrier are allowed on most domestic routes.
+    Customer: Is there a fee?
+    Agent: Yes, there's a fixed pet fee per flight.
+    """
+    },
+    {
+        "category": "General Inquiry",
+        "transcript": """
+    Agent: Thank you for calling Air Express.
+    Customer: I'm picking up my mother. What is the arrival time for flight AI234?
+    Agent: AI234 is expected to land at 7:00 PM at Terminal 1.
+    Customer: Thanks for the information.
+    Agent: You're welcome.
+    """
+    },
+    {
+        "category": "General Inquiry",
+        "transcript": """
+    Agent: Air Express, how can I help?
+    Customer: Can you tell me the status of flight AI890 from Kolkata?
+    Agent: AI890 is currently boarding at gate G9.
+    Customer: Okay, that's all I needed to know.
+    Agent: Have a nice day.
+    """
+    }
+]
@@ -0,0 +1,105 @@
+import argparse
+import json
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
+
+from data import FLIGHT_DATABASE, SAMPLE_TRANSCRIPTS
+import agents
+from agents import info_agent_request, qa_agent_respond, categorize_call, compute_call_center_kpis, is_together_available
+from scheduler import INTERACTIVE, HEAVY, Scheduler, SchedulerOverloaded, call_center_scheduler
+
+def with_latency(fn: Callable, seconds: float) -> Callable:
+    # Adds a fixed delay so offline heavy jobs cost roughly what a remote LLM call would
+    def wrapper(*args):
+        time.sleep(seconds)
+        return fn(*args)
+    wrapper.__name__ = fn.__name__
+    return wrapper
+
+def build_jobs(interactive_calls: int, heavy_calls: int, heavy_latency: float) -> List[tuple]:
+    flights = list(FLIGHT_DATABASE.keys())
+    categorize, compute_kpis = categorize_call, compute_call_center_kpis
+    if not is_together_available():
+        # Live runs already pay the real LLM latency
+        categorize = with_latency(categorize, heavy_latency)
+        compute_kpis = with_latency(compute_kpis, heavy_latency)
+
+    jobs = []
+    for i in range(interactive_calls):
+        flight = random.choice(flights)
+        if i % 2:
+            jobs.append((INTERACTIVE, info_agent_request, (flight,)))
+        else:
+            jobs.append((INTERACTIVE, qa_agent_respond, (f"What is the status of flight {flight}?",)))
+    for i in range(heavy_calls):
+        if i % 2:
+            jobs.append((HEAVY, categorize, (random.choice(SAMPLE_TRANSCRIPTS),)))
+        else:
+            jobs.append((HEAVY, compute_kpis, (tuple(SAMPLE_TRANSCRIPTS),)))
+
+    random.shuffle(jobs)
+    return jobs
+
+def run_job(scheduler: Scheduler, lane: str, fn: Callable, args: tuple) -> Dict:
+    started = time.monotonic()
+    try:
+        scheduler.submit(lane, fn, *args)
+        outcome = "ok"
+    except SchedulerOverloaded as e:
+        outcome = "cached" if e.cached is not None else "rejected"
+    return {"lane": lane, "outcome": outcome, "latency": time.monotonic() - started}
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct))]
+
+def summarize(results: List[Dict]) -> Dict:
+    summary = {}
+    for lane in (INTERACTIVE, HEAVY):
+        lane_results = [r for r in results if r["lane"] == lane]
+        latencies = [r["latency"] for r in lane_results if r["outcome"] == "ok"]
+        summary[lane] = {
+            "requests": len(lane_results),
+            "served_from_cache": sum(1 for r in lane_results if r["outcome"] == "cached"),
+            "rejected": sum(1 for r in lane_results if r["outcome"] == "rejected"),
+            "p50_latency_ms": round(percentile(latencies, 0.50) * 1000, 2),
+            "p95_latency_ms": round(percentile(latencies, 0.95) * 1000, 2),
+            "max_latency_ms": round(percentile(latencies, 1.0) * 1000, 2)
+        }
+    return summary
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent load generator for the call center scheduler.")
+    parser.add_argument("--interactive", type=int, default=400, help="Number of Info/Query requests")
+    parser.add_argument("--heavy", type=int, default=40, help="Number of Categorization/KPI requests")
+    parser.add_argument("--clients", type=int, default=64, help="Number of concurrent clients")
+    parser.add_argument("--heavy-latency", type=float, default=0.5, help="Simulated LLM latency in seconds for heavy requests (offline runs only)")
+    parser.add_argument("--live", action="store_true", help="Send requests to the Together API when TOGETHER_API_KEY is set")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if not args.live:
+        # Never spend API credits by accident: offline runs use the keyword/local backends
+        agents.together_api_key = None
+
+    random.seed(args.seed)
+    jobs = build_jobs(args.interactive, args.heavy, args.heavy_latency)
+
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=args.clients) as pool:
+        results = list(pool.map(lambda job: run_job(call_center_scheduler, *job), jobs))
+    elapsed = time.monotonic() - started
+
+    print(json.dumps({
+        "live": is_together_available(),
+        "elapsed_s": round(elapsed, 2),
+        "client_latency": summarize(results),
+        "scheduler_metrics": call_center_scheduler.metrics()
+    }, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+import json
+import threading
+import time
+from collections import OrderedDict, deque
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+INTERACTIVE = "interactive"
+HEAVY = "heavy"
+
+WAIT_SAMPLE_SIZE = 500
+
+# Workers beyond the admitted jobs, so requests arriving while every lane is full still get shed
+SHED_WORKERS = 4
+
+class Lane:
+    def __init__(self, name: str, priority: int, max_concurrency: int, max_queue_depth: int,
+                 cache_size: int = 64, cache_ttl: float = 60.0, max_wait: Optional[float] = None):
+        self.name = name
+        self.priority = priority
+        self.max_concurrency = max_concurrency
+        self.max_queue_depth = max_queue_depth
+        # Seconds a request may wait in the queue before it is shed; None waits indefinitely
+        self.max_wait = max_wait
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+
+        self.queue = deque()
+        self.running = 0
+        self.peak_queue_depth = 0
+        self.completed = 0
+        self.served_from_cache = 0
+        self.rejected = 0
+        self.wait_times = deque(maxlen=WAIT_SAMPLE_SIZE)
+        self.cache = OrderedDict()
+
+    def has_free_slot(self) -> bool:
+        return self.running < self.max_concurrency
+
+    def cache_get(self, key: Optional[Hashable]) -> Optional[Tuple[Any, float]]:
+        # Returns (value, stored_at) for entries younger than the TTL
+        if key is None or key not in self.cache:
+            return None
+        value, stored_at = self.cache[key]
+        if time.time() - stored_at > self.cache_ttl:
+            del self.cache[key]
+            return None
+        self.cache.move_to_end(key)
+        return value, stored_at
+
+    def cache_put(self, key: Optional[Hashable], value: Any) -> None:
+        if key is None or self.cache_size <= 0:
+            return
+        self.cache[key] = (value, time.time())
+        self.cache.move_to_end(key)
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
+    def snapshot(self) -> Dict[str, Any]:
+        waits = sorted(self.wait_times)
+        if waits:
+            avg_wait = sum(waits) / len(waits)
+            p95_wait = waits[min(len(waits) - 1, int(len(waits) * 0.95))]
+            max_wait = waits[-1]
+        else:
+            avg_wait = p95_wait = max_wait = 0.0
+
+        return {
+            "priority": self.priority,
+            "max_concurrency": self.max_concurrency,
+            "max_queue_depth": self.max_queue_depth,
+            "queue_timeout_s": self.max_wait,
+            "cache_ttl_s": self.cache_ttl,
+            "running": self.running,
+            "queue_depth": len(self.queue),
+            "peak_queue_depth": self.peak_queue_depth,
+            "completed": self.completed,
+            "served_from_cache": self.served_from_cache,
+            "rejected": self.rejected,
+            "avg_wait_ms": round(avg_wait * 1000, 2),
+            "p95_wait_ms": round(p95_wait * 1000, 2),
+            "max_wait_ms": round(max_wait * 1000, 2)
+        }
+
+class SchedulerOverloaded(Exception):
+    def __init__(self, message: str, cached: Any = None, cached_at: Optional[float] = None):
+        super().__init__(message)
+        self.cached = cached
+        self.cached_at = cached_at
+
+class Scheduler:
+    def __init__(self, lanes: List[Lane]):
+        self.lanes = {lane.name: lane for lane in lanes}
+        self.condition = threading.Condition()
+        self.queue_probes: Dict[str, Callable[[], Dict[str, Any]]] = {}
+
+    def worker_slots(self) -> int:
+        # One worker per admitted job plus spares that only ever run the shed path
+        return sum(lane.max_concurrency + lane.max_queue_depth for lane in self.lanes.values()) + SHED_WORKERS
+
+    def watch_queue(self, name: str, probe: Callable[[], Dict[str, Any]]) -> None:
+        # Queues in front of the scheduler (e.g. Gradio's) are reported alongside the lanes
+        self.queue_probes[name] = probe
+
+    def _can_start(self, lane: Lane, ticket: object) -> bool:
+        if lane.queue[0] is not ticket or not lane.has_free_slot():
+            return False
+
+        # Lower priority lanes hold back while a higher priority lane is busy or has work queued
+        for other in self.lanes.values():
+            if other.priority > lane.priority and (other.queue or not other.has_free_slot()):
+                return False
+        return True
+
+    def _shed(self, lane: Lane, key: Optional[Hashable], message: str) -> None:
+        # Called with the condition held; always raises
+        cached = lane.cache_get(key)
+        if cached is not None:
+            lane.served_from_cache += 1
+            raise SchedulerOverloaded(message, *cached)
+        lane.rejected += 1
+        raise SchedulerOverloaded(message)
+
+    def submit(self, lane_name: str, fn: Callable, *args) -> Any:
+        lane = self.lanes[lane_name]
+
+        key = (fn.__name__, args)
+        try:
+            hash(key)
+        except TypeError:
+            key = None
+
+        ticket = object()
+        with self.condition:
+            if len(lane.queue) >= lane.max_queue_depth:
+                self._shed(lane, key, f"The {lane.name} queue is full ({lane.max_queue_depth} waiting).")
+
+            enqueued_at = time.monotonic()
+            lane.queue.append(ticket)
+            lane.peak_queue_depth = max(lane.peak_queue_depth, len(lane.queue))
+
+            while not self._can_start(lane, ticket):
+                timeout = None
+                if lane.max_wait is not None:
+                    timeout = enqueued_at + lane.max_wait - time.monotonic()
+                    if timeout <= 0:
+                        # Give up our place so the requests behind us can move up
+                        lane.queue.remove(ticket)
+                        self.condition.notify_all()
+                        self._shed(lane, key, f"The {lane.name} queue did not clear within {lane.max_wait:g}s.")
+                self.condition.wait(timeout)
+
+            lane.queue.popleft()
+            lane.running += 1
+            lane.wait_times.append(time.monotonic() - enqueued_at)
+            self.condition.notify_all()
+
+        try:
+            result = fn(*args)
+        finally:
+            with self.condition:
+                lane.running -= 1
+                lane.completed += 1
+                self.condition.notify_all()
+
+        with self.condition:
+            lane.cache_put(key, result)
+
+        return result
+
+    def metrics(self) -> Dict[str, Any]:
+        with self.condition:
+            metrics = {name: lane.snapshot() for name, lane in self.lanes.items()}
+        for name, probe in self.queue_probes.items():
+            metrics[name] = probe()
+        return metrics
+
+call_center_scheduler = Scheduler([
+    Lane(INTERACTIVE, priority=1, max_concurrency=8, max_queue_depth=32, cache_ttl=30.0, max_wait=10.0),
+    Lane(HEAVY, priority=0, max_concurrency=2, max_queue_depth=4, cache_ttl=300.0, max_wait=60.0)
+])
+
+def scheduled(lane_name: str, scheduler: Scheduler = call_center_scheduler) -> Callable:
+    def decorator(fn: Callable) -> Callable:
+        @wraps(fn)
+        def wrapper(*args):
+            try:
+                return scheduler.submit(lane_name, fn, *args)
+            except SchedulerOverloaded as e:
+                if e.cached is not None:
+                    cached_at = time.strftime("%H:%M:%S", time.localtime(e.cached_at))
+                    age = round(time.time() - e.cached_at)
+                    return f"System busy: showing a cached result from {cached_at} ({age}s old).\n\n{e.cached}"
+                return json.dumps({"error": f"System busy: {str(e)} Please try again shortly."}, indent=2)
+        return wrapper
+    return decorator
+
+def scheduler_metrics_ui() -> str:
+    return json.dumps(call_center_scheduler.metrics(), indent=2)
@@ -0,0 +1,129 @@
+import zlib
+
+import numpy as np
+import pytest
+
+import agents
+import classifier
+from classifier import hash_features, load_model, tokenize, train_from_labelled
+from data import LABELLED_TRANSCRIPTS, SAMPLE_TRANSCRIPTS
+
+MASK = 2 ** 64 - 1
+N_FEATURES = 2 ** 12
+
+def mix(value: int) -> int:
+    value ^= value >> 29
+    value = (value * 0xBF58476D1CE4E5B9) & MASK
+    return value ^ (value >> 32)
+
+def reference_columns(text: str, n_features: int) -> list:
+    # Scalar re-implementation of the hashing for a single transcript
+    hashes = [zlib.crc32(word.encode("utf-8")) for word in tokenize(text.replace("\x01", " "))]
+    columns = [mix(h) % n_features for h in hashes]
+    columns += [mix((a * 0x9E3779B1 + b) & MASK) % n_features for a, b in zip(hashes, hashes[1:])]
+    return sorted(columns)
+
+TEXTS = [
+    "I need to cancel my flight",
+    "",
+    "Agent: hello\x01there Customer: my bag\x01 is lost",
+    "   ",
+    "change seat",
+    "window",
+    SAMPLE_TRANSCRIPTS[1]
+]
+
+@pytest.fixture(scope="module")
+def model():
+    return train_from_labelled(LABELLED_TRANSCRIPTS, n_features=N_FEATURES, epochs=50)
+
+def test_hash_features_matches_per_transcript_reference():
+    rows, columns, norms = hash_features(TEXTS, N_FEATURES)
+
+    assert np.all(np.diff(rows) >= 0)
+    for i, text in enumerate(TEXTS):
+        expected = reference_columns(text, N_FEATURES)
+        assert sorted(columns[rows == i].tolist()) == expected
+        assert norms[i] == pytest.approx(1.0 / np.sqrt(max(len(expected), 1)))
+
+def test_bigrams_do_not_cross_transcripts():
+    rows, columns, _ = hash_features(["alpha beta", "", "gamma"], N_FEATURES)
+
+    # alpha, beta, "alpha beta" and gamma; no "beta gamma" bigram across the empty transcript
+    assert rows.tolist() == [0, 0, 0, 2]
+    assert sorted(columns[rows == 0].tolist()) == reference_columns("alpha beta", N_FEATURES)
+    assert columns[rows == 2].tolist() == reference_columns("gamma", N_FEATURES)
+
+def test_hash_features_handles_empty_batch():
+    rows, columns, norms = hash_features([], N_FEATURES)
+    assert len(rows) == len(columns) == len(norms) == 0
+
+def test_batched_predict_matches_single_predictions(model, monkeypatch):
+    monkeypatch.setattr(classifier, "BATCH_SIZE", 3)
+
+    batched = model.predict(TEXTS)
+    single = [model.predict([text])[0] for text in TEXTS]
+    assert batched == single
+
+    np.testing.assert_allclose(
+        model.decision_function(TEXTS),
+        np.vstack([model.decision_function([text]) for text in TEXTS]),
+        rtol=1e-5,
+        atol=1e-6
+    )
+
+def test_saved_model_loads_with_same_predictions(model, tmp_path):
+    path = str(tmp_path / "models" / "call_classifier.npz")
+    model.save(path)
+    loaded = load_model(path)
+
+    assert loaded.classes == model.classes
+    assert loaded.n_features == model.n_features
+    assert loaded.predict(TEXTS) == model.predict(TEXTS)
+
+def test_load_model_without_file_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_model(str(tmp_path / "missing.npz"))
+
+@pytest.fixture
+def offline(monkeypatch, tmp_path):
+    monkeypatch.setattr(agents, "together_api_key", None)
+    monkeypatch.setenv("CALL_CLASSIFIER_MODEL", str(tmp_path / "call_classifier.npz"))
+    return tmp_path / "call_classifier.npz"
+
+def test_auto_backend_without_key_or_model_uses_keywords(offline, monkeypatch):
+    monkeypatch.setenv("CATEGORIZATION_BACKEND", "auto")
+    assert agents.get_categorization_backend() == "keywords"
+
+def test_auto_backend_uses_saved_model(offline, monkeypatch, model):
+    model.save(str(offline))
+    monkeypatch.setenv("CATEGORIZATION_BACKEND", "auto")
+    assert agents.get_categorization_backend() == "local"
+
+def test_auto_backend_prefers_together_with_key(offline, monkeypatch):
+    monkeypatch.setattr(agents, "together_api_key", "test-key")
+    monkeypatch.setenv("CATEGORIZATION_BACKEND", "auto")
+    assert agents.get_categorization_backend() == "together"
+
+def test_local_backend_without_model_falls_back_to_keywords(offline, monkeypatch):
+    monkeypatch.setenv("CATEGORIZATION_BACKEND", "local")
+    assert agents.get_categorization_backend() == "keywords"
+
+def test_local_backend_with_model(offline, monkeypatch, model):
+    model.save(str(offline))
+    monkeypatch.setenv("CATEGORIZATION_BACKEND", "local")
+    assert agents.get_categorization_backend() == "local"
+
+def test_together_backend_without_key_falls_back_to_keywords(offline, monkeypatch):
+    monkeypatch.setenv("CATEGORIZATION_BACKEND", "together")
+    assert agents.get_categorization_backend() == "keywords"
+
+def test_unknown_backend_raises(offline, monkeypatch):
+    monkeypatch.setenv("CATEGORIZATION_BACKEND", "bogus")
+    with pytest.raises(ValueError):
+        agents.get_categorization_backend()
+
+def test_keyword_categorize_keeps_the_last_matching_category():
+    assert agents.keyword_categorize("May I have your booking reference? I lost my bag.") == "Baggage Issue"
+    assert agents.keyword_categorize("My bag is lost and I want a window seat.") == "Seat Change"
+    assert agents.keyword_categorize("Hello there") == "General Inquiry"
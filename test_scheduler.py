@@ -0,0 +1,207 @@
+import threading
+import time
+
+import pytest
+
+import scheduler
+from scheduler import INTERACTIVE, HEAVY, SHED_WORKERS, Lane, Scheduler, SchedulerOverloaded, scheduled
+
+def make_scheduler(interactive_depth: int = 3, heavy_depth: int = 2, cache_ttl: float = 60.0,
+                   heavy_max_wait: float = None) -> Scheduler:
+    return Scheduler([
+        Lane(INTERACTIVE, priority=1, max_concurrency=1, max_queue_depth=interactive_depth, cache_ttl=cache_ttl),
+        Lane(HEAVY, priority=0, max_concurrency=1, max_queue_depth=heavy_depth, cache_ttl=cache_ttl,
+             max_wait=heavy_max_wait)
+    ])
+
+def wait_until(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out waiting for scheduler state"
+        time.sleep(0.001)
+
+def queue_depth(s: Scheduler, lane_name: str) -> int:
+    with s.condition:
+        return len(s.lanes[lane_name].queue)
+
+def submit_in_thread(s: Scheduler, lane_name: str, fn, *args) -> threading.Thread:
+    thread = threading.Thread(target=s.submit, args=(lane_name, fn) + args)
+    thread.start()
+    return thread
+
+class Recorder:
+    def __init__(self):
+        self.started = []
+        self.lock = threading.Lock()
+        self.release = threading.Event()
+
+    def blocking(self, name: str) -> str:
+        with self.lock:
+            self.started.append(name)
+        self.release.wait(5)
+        return name
+
+    def instant(self, name: str) -> str:
+        with self.lock:
+            self.started.append(name)
+        return name
+
+def test_heavy_waits_for_queued_interactive_work():
+    s = make_scheduler()
+    recorder = Recorder()
+
+    threads = [submit_in_thread(s, INTERACTIVE, recorder.blocking, "i0")]
+    wait_until(lambda: recorder.started == ["i0"])
+
+    for i, name in enumerate(["i1", "i2", "i3"], start=1):
+        threads.append(submit_in_thread(s, INTERACTIVE, recorder.instant, name))
+        wait_until(lambda: queue_depth(s, INTERACTIVE) == i)
+
+    threads.append(submit_in_thread(s, HEAVY, recorder.instant, "h0"))
+    wait_until(lambda: queue_depth(s, HEAVY) == 1)
+    assert recorder.started == ["i0"]
+
+    recorder.release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert recorder.started == ["i0", "i1", "i2", "i3", "h0"]
+
+def test_heavy_waits_while_interactive_lane_is_full():
+    s = make_scheduler()
+    recorder = Recorder()
+
+    interactive = submit_in_thread(s, INTERACTIVE, recorder.blocking, "i0")
+    wait_until(lambda: recorder.started == ["i0"])
+
+    heavy = submit_in_thread(s, HEAVY, recorder.instant, "h0")
+    wait_until(lambda: queue_depth(s, HEAVY) == 1)
+    assert recorder.started == ["i0"]
+
+    recorder.release.set()
+    interactive.join(5)
+    heavy.join(5)
+
+    assert recorder.started == ["i0", "h0"]
+
+def test_heavy_request_is_shed_after_max_wait():
+    s = make_scheduler(heavy_max_wait=0.05)
+    recorder = Recorder()
+
+    interactive = submit_in_thread(s, INTERACTIVE, recorder.blocking, "i0")
+    wait_until(lambda: recorder.started == ["i0"])
+
+    with pytest.raises(SchedulerOverloaded) as excinfo:
+        s.submit(HEAVY, recorder.instant, "h0")
+    assert excinfo.value.cached is None
+    assert queue_depth(s, HEAVY) == 0
+    assert s.metrics()[HEAVY]["rejected"] == 1
+    assert recorder.started == ["i0"]
+
+    recorder.release.set()
+    interactive.join(5)
+
+    assert s.submit(HEAVY, recorder.instant, "h1") == "h1"
+    assert recorder.started == ["i0", "h1"]
+
+def test_timed_out_request_serves_cached_result():
+    s = make_scheduler(heavy_max_wait=0.05)
+    assert s.submit(HEAVY, lookup, "AI123") == "status of AI123"
+
+    recorder = Recorder()
+    interactive = submit_in_thread(s, INTERACTIVE, recorder.blocking, "i0")
+    wait_until(lambda: recorder.started == ["i0"])
+
+    with pytest.raises(SchedulerOverloaded) as excinfo:
+        s.submit(HEAVY, lookup, "AI123")
+    assert excinfo.value.cached == "status of AI123"
+    assert queue_depth(s, HEAVY) == 0
+    assert s.metrics()[HEAVY]["served_from_cache"] == 1
+
+    recorder.release.set()
+    interactive.join(5)
+
+def test_interactive_is_not_held_back_by_heavy_work():
+    s = make_scheduler()
+    recorder = Recorder()
+
+    heavy = submit_in_thread(s, HEAVY, recorder.blocking, "h0")
+    wait_until(lambda: recorder.started == ["h0"])
+
+    assert s.submit(INTERACTIVE, recorder.instant, "i0") == "i0"
+
+    recorder.release.set()
+    heavy.join(5)
+
+def fill_interactive_lane(s: Scheduler, recorder: Recorder) -> list:
+    threads = [submit_in_thread(s, INTERACTIVE, recorder.blocking, "running")]
+    wait_until(lambda: recorder.started == ["running"])
+    threads.append(submit_in_thread(s, INTERACTIVE, recorder.blocking, "queued"))
+    wait_until(lambda: queue_depth(s, INTERACTIVE) == 1)
+    return threads
+
+def lookup(flight_number: str) -> str:
+    return f"status of {flight_number}"
+
+def test_full_queue_rejects_without_cached_result():
+    s = make_scheduler(interactive_depth=1)
+    recorder = Recorder()
+    threads = fill_interactive_lane(s, recorder)
+
+    with pytest.raises(SchedulerOverloaded) as excinfo:
+        s.submit(INTERACTIVE, lookup, "AI123")
+    assert excinfo.value.cached is None
+    assert s.metrics()[INTERACTIVE]["rejected"] == 1
+
+    recorder.release.set()
+    for thread in threads:
+        thread.join(5)
+
+def test_full_queue_serves_recent_cached_result_with_timestamp():
+    s = make_scheduler(interactive_depth=1)
+    assert s.submit(INTERACTIVE, lookup, "AI123") == "status of AI123"
+
+    recorder = Recorder()
+    threads = fill_interactive_lane(s, recorder)
+
+    with pytest.raises(SchedulerOverloaded) as excinfo:
+        s.submit(INTERACTIVE, lookup, "AI123")
+    assert excinfo.value.cached == "status of AI123"
+    assert excinfo.value.cached_at <= time.time()
+
+    response = scheduled(INTERACTIVE, s)(lookup)("AI123")
+    assert response.startswith("System busy: showing a cached result from")
+    assert response.endswith("status of AI123")
+    assert s.metrics()[INTERACTIVE]["served_from_cache"] == 2
+
+    recorder.release.set()
+    for thread in threads:
+        thread.join(5)
+
+def test_expired_cached_result_is_not_served(monkeypatch):
+    s = make_scheduler(interactive_depth=1, cache_ttl=30.0)
+    assert s.submit(INTERACTIVE, lookup, "AI123") == "status of AI123"
+
+    recorder = Recorder()
+    threads = fill_interactive_lane(s, recorder)
+
+    now = time.time()
+    monkeypatch.setattr(scheduler.time, "time", lambda: now + 31.0)
+
+    with pytest.raises(SchedulerOverloaded) as excinfo:
+        s.submit(INTERACTIVE, lookup, "AI123")
+    assert excinfo.value.cached is None
+
+    monkeypatch.undo()
+    recorder.release.set()
+    for thread in threads:
+        thread.join(5)
+
+def test_worker_slots_leave_room_for_shedding():
+    s = make_scheduler(interactive_depth=3, heavy_depth=2)
+    assert s.worker_slots() == (1 + 3) + (1 + 2) + SHED_WORKERS
+
+def test_metrics_include_watched_queues():
+    s = make_scheduler()
+    s.watch_queue("gradio", lambda: {"queue_depth": 0})
+    assert s.metrics()["gradio"] == {"queue_depth": 0}
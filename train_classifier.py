@@ -0,0 +1,117 @@
+import argparse
+import json
+import random
+import sys
+import time
+from typing import Dict, List
+
+from data import LABELLED_TRANSCRIPTS
+from agents import keyword_categorize
+from classifier import DEFAULT_N_FEATURES, get_model_path, train_from_labelled
+
+def load_labelled(path: str) -> List[Dict[str, str]]:
+    examples = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                example = json.loads(line)
+                examples.append({"transcript": example["transcript"], "category": example["category"]})
+    return examples
+
+def split_examples(examples: List[Dict[str, str]], test_fraction: float, seed: int) -> tuple:
+    # Stratified so every category appears in both splits
+    by_category = {}
+    for example in examples:
+        by_category.setdefault(example["category"], []).append(example)
+
+    rng = random.Random(seed)
+    train, test = [], []
+    for category_examples in by_category.values():
+        rng.shuffle(category_examples)
+        n_test = min(len(category_examples) - 1, max(1, round(len(category_examples) * test_fraction)))
+        test.extend(category_examples[:n_test])
+        train.extend(category_examples[n_test:])
+    return train, test
+
+def evaluate(predictions: List[str], labels: List[str]) -> Dict:
+    per_category = {}
+    for category in sorted(set(labels) | set(predictions)):
+        true_positive = sum(1 for p, l in zip(predictions, labels) if p == category and l == category)
+        predicted = sum(1 for p in predictions if p == category)
+        actual = sum(1 for l in labels if l == category)
+        per_category[category] = {
+            "precision": round(true_positive / predicted, 3) if predicted else 0.0,
+            "recall": round(true_positive / actual, 3) if actual else 0.0,
+            "support": actual
+        }
+
+    correct = sum(1 for p, l in zip(predictions, labels) if p == l)
+    return {
+        "accuracy": round(correct / len(labels), 3) if labels else 0.0,
+        "per_category": per_category
+    }
+
+def benchmark(model, transcripts: List[str], n: int) -> Dict:
+    batch = (transcripts * (n // len(transcripts) + 1))[:n]
+    model.predict(batch[:100])
+
+    started = time.perf_counter()
+    model.predict(batch)
+    elapsed = time.perf_counter() - started
+
+    return {
+        "transcripts": n,
+        "seconds": round(elapsed, 3),
+        "transcripts_per_second": round(n / elapsed)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Train and evaluate the local call categorization model.")
+    parser.add_argument("--data", help="JSONL file with 'transcript' and 'category' fields, added to the built-in examples")
+    parser.add_argument("--output", default=get_model_path(), help="Where to save the trained model")
+    parser.add_argument("--test-fraction", type=float, default=0.2)
+    parser.add_argument("--features", type=int, default=DEFAULT_N_FEATURES, help="Number of hashed feature columns")
+    parser.add_argument("--epochs", type=int, default=300)
+    parser.add_argument("--learning-rate", type=float, default=2.0)
+    parser.add_argument("--l2", type=float, default=1e-4)
+    parser.add_argument("--benchmark", type=int, default=50000, help="Transcripts to classify for the throughput benchmark")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--force", action="store_true", help="Save the model even if it scores below the keyword baseline")
+    args = parser.parse_args()
+
+    examples = list(LABELLED_TRANSCRIPTS)
+    if args.data:
+        examples.extend(load_labelled(args.data))
+
+    hyperparameters = {"n_features": args.features, "epochs": args.epochs, "learning_rate": args.learning_rate, "l2": args.l2}
+
+    train, test = split_examples(examples, args.test_fraction, args.seed)
+    model = train_from_labelled(train, **hyperparameters)
+
+    test_transcripts = [example["transcript"] for example in test]
+    test_labels = [example["category"] for example in test]
+
+    report = {
+        "train_examples": len(train),
+        "test_examples": len(test),
+        "local_classifier": evaluate(model.predict(test_transcripts), test_labels),
+        "keyword_baseline": evaluate([keyword_categorize(t) for t in test_transcripts], test_labels),
+        "throughput": benchmark(model, [example["transcript"] for example in examples], args.benchmark)
+    }
+
+    # A saved model is picked up by the auto backend, so it has to beat keyword matching first
+    if report["local_classifier"]["accuracy"] < report["keyword_baseline"]["accuracy"] and not args.force:
+        report["saved_to"] = None
+        print(json.dumps(report, indent=2))
+        print("Local classifier scored below the keyword baseline; model not saved. Add more labelled data or pass --force.", file=sys.stderr)
+        sys.exit(1)
+
+    # The saved model is refit on every example once the held-out scores are in
+    model = train_from_labelled(examples, **hyperparameters)
+    model.save(args.output)
+    report["saved_to"] = args.output
+
+    print(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    main()